@@ -1,29 +1,98 @@
 # pbfcm_api.py
 # FastAPI endpoint for PBFCM tax sale list (perfect for n8n)
 # GET /pbfcm/scrape → returns { source_url, count, raw[], normalized[] }
+#   results are cached in-memory for a short TTL; ?fresh=1 forces a re-scrape
 
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import logging
+import os
+
+# event loop: uvicorn picks uvloop/httptools itself (start.sh passes --loop uvloop --http httptools)
+
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import ORJSONResponse
 
 from pbfcm_engine import PBFcmsScraper
 
 app = FastAPI(title="PBFCM taxsale scraper", default_response_class=ORJSONResponse)
 
-scraper = PBFcmsScraper(headless=True)
+# optional on-disk Chromium profile (opt-in via PBF_USER_DATA_DIR); one dir per worker
+scraper = PBFcmsScraper(headless=True, user_data_dir=os.environ.get("PBF_USER_DATA_DIR") or None)
+
+log = logging.getLogger("uvicorn.error")
+
+_tasks = []
+
+async def _refresher(interval: float):
+    # re-scrape before the cache entry expires so requests never wait on a scrape
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await scraper.scrape(fresh=True)
+        except Exception:
+            # on failure the entry expires and the next request retries
+            log.exception("background scrape refresh failed")
+
+async def _warm():
+    try:
+        await scraper.scrape()
+    except Exception:
+        log.exception("startup cache warm-up failed")  # first request will retry
 
 @app.on_event("startup")
 async def _startup():
     await scraper.start()
+    _tasks.append(asyncio.create_task(_warm()))
+    _tasks.append(asyncio.create_task(_refresher(max(1.0, scraper._cache_ttl * 0.8))))
 
 @app.on_event("shutdown")
 async def _shutdown():
+    for t in _tasks:
+        t.cancel()
+    for t in _tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await t
+    _tasks.clear()
     await scraper.stop()
 
+# constant body, built once
+_HEALTH_OK = Response(b'{"ok":true}', media_type="application/json")
+
 @app.get("/pbfcm/health")
 async def health():
-    return {"ok": True}
+    return _HEALTH_OK
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # RFC 9110 Accept-Encoding: an explicit "gzip" entry wins over "*"; q=0 means "not acceptable"
+    star = None
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for p in params:
+            k, _, v = p.partition("=")
+            if k.strip().lower() == "q":
+                try:
+                    q = float(v)
+                except ValueError:
+                    q = 0.0
+        if coding == "*":
+            star = q > 0
+        else:
+            return q > 0
+    return bool(star)
 
 @app.get("/pbfcm/scrape")
-async def scrape():
-    data = await scraper.scrape()
-    return data
+async def scrape(request: Request, fresh: bool = False):
+    # serve the pre-serialized (and pre-gzipped) bytes; skips jsonable_encoder on every request
+    await scraper.scrape(fresh=fresh)
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            scraper._cached_gz,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(scraper._cached_bytes, media_type="application/json", headers={"Vary": "Accept-Encoding"})
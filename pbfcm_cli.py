@@ -2,9 +2,11 @@
 # Colorful CLI for PBF tax sale list scraper
 # - Streams both RAW (requested field names) and normalized CSV/NDJSON if desired
 
-import sys, csv, argparse, asyncio, json
+import sys, re, csv, argparse, asyncio
 from typing import Optional
 
+import orjson
+
 from pbfcm_engine import PBFcmsScraper
 
 # optional colors
@@ -20,9 +22,21 @@ except Exception:
 RAW_HEADERS = ["tax-list-entity-title", "tax-list-file", "tax-list-file href"]
 CSV_FIELDS = ["entity_title", "file_label", "file_url", "file_type"]
 
+# TSV field sanitizer: tabs/newlines → space in a single C-level pass
+_TAB_TRANS = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+
+_WS_RE = re.compile(r"\s+")
+# ASCII whitespace other than " " that str.split() also collapses
+_WS_CHARS = frozenset("\t\n\v\f\r\x1c\x1d\x1e\x1f")
+
 def _short(s: Optional[str], n: int = 100) -> str:
     if not s: return ""
-    s = " ".join(s.split())
+    # fast path: only run the regex when there is a whitespace run to collapse
+    # (non-ASCII text may hold NBSP/Unicode spaces, so it always takes the regex)
+    if not s.isascii() or "  " in s or not _WS_CHARS.isdisjoint(s):
+        s = _WS_RE.sub(" ", s).strip()
+    else:
+        s = s.strip()
     return s if len(s) <= n else (s[: n-1] + "…")
 
 async def main():
@@ -33,7 +47,8 @@ async def main():
     ap.add_argument("--ndjson", type=str, help="Write normalized NDJSON to file")
     ap.add_argument("--no-colors", action="store_true", help="Disable colored logs")
     ap.add_argument("--no-progress", action="store_true", help="Disable progress lines")
-    ap.add_argument("--no-headless", action="store_true", help="Show browser window")
+    ap.add_argument("--no-headless", action="store_true", help="Show browser window (implies --backend playwright)")
+    ap.add_argument("--backend", choices=["http", "playwright"], help="Fetch backend (default: http; playwright with --no-headless)")
     args = ap.parse_args()
 
     raw_tsv = None
@@ -44,25 +59,36 @@ async def main():
         raw_tsv = sys.stdout
         raw_tsv.write("\t".join(RAW_HEADERS) + "\n")
 
-    csv_out = open(args.out_csv, "w", encoding="utf-8", newline="") if args.out_csv else None
+    csv_out = open(args.out_csv, "w", encoding="utf-8", newline="", buffering=1 << 20) if args.out_csv else None
     csv_writer = None
     if csv_out:
-        csv_writer = csv.DictWriter(csv_out, fieldnames=CSV_FIELDS)
-        csv_writer.writeheader()
+        # plain writer + tuples: no per-field dict lookups inside DictWriter
+        csv_writer = csv.writer(csv_out)
+        csv_writer.writerow(CSV_FIELDS)
 
-    ndjson_out = open(args.ndjson, "w", encoding="utf-8") if args.ndjson else None
+    ndjson_out = open(args.ndjson, "wb") if args.ndjson else None
 
     console = Console(stderr=True) if (RICH and not args.no_colors and not args.no_progress) else None
 
-    scraper = PBFcmsScraper(headless=not args.no_headless)
+    backend = args.backend or ("playwright" if args.no_headless else "http")
+    scraper = PBFcmsScraper(headless=not args.no_headless, backend=backend)
     try:
         data = await scraper.scrape()
         raw = data["raw"]
         norm = data["normalized"]
 
-        # print progress
-        if not args.no_progress:
-            for i, n in enumerate(norm, 1):
+        progress = not args.no_progress
+        # bound-local method refs keep attribute lookups out of the hot loop
+        tsv_lines = [] if raw_tsv else None
+        tsv_append = tsv_lines.append if raw_tsv else None
+        csv_row = csv_writer.writerow if csv_writer else None
+        nd_buf = bytearray() if ndjson_out else None
+        dumps = orjson.dumps
+        nl_opt = orjson.OPT_APPEND_NEWLINE
+
+        # single pass: progress + TSV + CSV + NDJSON per row
+        for i, (r, n) in enumerate(zip(raw, norm), 1):
+            if progress:
                 line = f"[{i:03d}] {_short(n.get('entity_title'))}  —  {_short(n.get('file_label'))}"
                 if console:
                     t = Text(line)
@@ -74,21 +100,24 @@ async def main():
                 else:
                     print(line, file=sys.stderr)
 
-        # stream outputs
+            if tsv_append:
+                tsv_append("\t".join([(r.get(h) or "").translate(_TAB_TRANS).strip() for h in RAW_HEADERS]))
+                tsv_append("\n")
+
+            if csv_row:
+                csv_row((n.get("entity_title"), n.get("file_label"), n.get("file_url"), n.get("file_type")))
+
+            if nd_buf is not None:
+                # orjson emits UTF-8 bytes; batched and written once below
+                nd_buf += dumps(n, option=nl_opt)
+
         if raw_tsv:
-            for r in raw:
-                row = [ (r.get(h) or "").replace("\t"," ").replace("\n"," ").strip() for h in RAW_HEADERS ]
-                raw_tsv.write("\t".join(row) + "\n")
+            raw_tsv.writelines(tsv_lines)
             raw_tsv.flush()
-
-        if csv_writer:
-            for n in norm:
-                csv_writer.writerow(n)
+        if csv_out:
             csv_out.flush()
-
         if ndjson_out:
-            for n in norm:
-                ndjson_out.write(json.dumps(n, ensure_ascii=False) + "\n")
+            ndjson_out.write(nd_buf)
             ndjson_out.flush()
 
     finally:
@@ -9,14 +9,117 @@
 #     entity_title, file_label, file_url, file_type
 # - Shares the same performance ideas as your first scraper:
 #     headless Chromium, resource blocking, single-pass DOM evaluate
+# - backend="http" (default) fetches the static HTML with httpx and parses it
+#   with selectolax; Chromium is only launched if that yields no rows
 
 import asyncio
+import contextlib
+import gzip
+import logging
+import re
+import time
+import orjson
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urldefrag, urlparse
+from urllib.parse import urljoin, urldefrag
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 PBF_URL = "https://www.pbfcm.com/taxsale.html"
 
+log = logging.getLogger(__name__)
+
+# request filter (compiled once, checked on every intercepted request):
+# heavy resource types, known trackers and third-party XHR/fetch are aborted
+_BLOCK_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCK_HOSTS = re.compile(
+    r"^https?://(?:[^/?#]*\.)?(?:google-analytics|googletagmanager|doubleclick|facebook|hotjar|fullstory|segment)\.[^/?#]*(?:[/?#]|$)",
+    re.I,
+)
+_XHR_TYPES = frozenset({"xhr", "fetch"})
+_FIRST_PARTY = re.compile(r"^https?://(?:[^/?#]*\.)?pbfcm\.com(?::\d+)?(?:[/?#]|$)", re.I)
+
+# Chromium flags: skip automation/background work that only adds startup latency
+_CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+]
+
+# file-type suffixes (str.endswith accepts a tuple)
+_PDF = (".pdf",)
+_DOC = (".doc", ".docx")
+_XLS = (".xls", ".xlsx")
+
+def _file_type(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+    # cheap path extraction; avoids a urlparse() per row
+    p = url.split("?", 1)[0].split("#", 1)[0].lower()
+    if p.endswith(_PDF):
+        return "pdf"
+    if p.endswith(_DOC):
+        return "doc"
+    if p.endswith(_XLS):
+        return "xls"
+    return None
+
+def _text(node) -> Optional[str]:
+    # textContent with whitespace runs collapsed, same as the JS extractor
+    return " ".join(node.text(deep=True, separator="", strip=False).split()) or None
+
+def _parse_html(html: str, base: str) -> List[Dict[str, Optional[str]]]:
+    """
+    Static-HTML variant of _extract_js (explicit class path only).
+    Returns the same row shape and strings (URL percent-encoding may differ
+    from the browser's); empty list if the classes are absent.
+    """
+    tree = LexborHTMLParser(html)
+    # a.href honours <base href>, so resolve against it too
+    base_el = tree.css_first("base[href]")
+    if base_el is not None:
+        base = urljoin(base, base_el.attributes.get("href") or "")
+    seen = set()
+    rows: List[Dict[str, Optional[str]]] = []
+    for t in tree.css(".tax-list-entity-title"):
+        title = _text(t)
+        # common wrappers (closest() also checks the title element itself)
+        root = t.parent
+        node = t
+        while node is not None:
+            if "tax-list-entity" in (node.attributes.get("class") or "").split():
+                root = node
+                break
+            node = node.parent
+        if root is None:
+            continue
+        files = root.css(".tax-list-file, .tax-list-file a")
+        if not files:
+            # Fallback: same container links (PDFs or sale links)
+            files = root.css("a[href$='.pdf'], a[href*='sale'], a[href^='http'], a[href^='/']")
+        for f in files:
+            a = f if f.tag == "a" else f.css_first("a")
+            label = _text(a or f)
+            href = (a.attributes.get("href") or None) if a else None
+            if href:
+                href, _ = urldefrag(urljoin(base, href))
+            key = (title or "", label or "", href or "")
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append({
+                "tax-list-entity-title": title,
+                "tax-list-file": label,
+                "tax-list-file href": href,
+            })
+    return rows
+
 class PBFcmsScraper:
     def __init__(
         self,
@@ -29,6 +132,9 @@ class PBFcmsScraper:
             "(KHTML, like Gecko) Chrome/124 Safari/537.36"
         ),
         block_resources: bool = True,
+        cache_ttl: float = 120.0,
+        user_data_dir: Optional[str] = None,
+        backend: str = "http",
     ):
         self.headless = headless
         self.default_timeout_ms = default_timeout_ms
@@ -36,46 +142,175 @@ class PBFcmsScraper:
         self.locale = locale
         self.user_agent = user_agent
         self.block_resources = block_resources
+        # optional persistent profile dir (cookies/storage survive restarts).
+        # It does not keep an HTTP cache while request routing is on, and
+        # Chromium locks the dir, so it cannot be shared between workers.
+        self.user_data_dir = user_data_dir
+        if backend not in ("http", "playwright"):
+            raise ValueError(f"unknown backend: {backend!r}")
+        self.backend = backend
+        self._http: Optional[httpx.AsyncClient] = None
         self._pw = None
         self._browser: Optional[Browser] = None
+        self._ctx: Optional[BrowserContext] = None
+        # one pre-opened page reused across scrapes (skips new_page() per call);
+        # scrape() serializes callers behind _lock, so one page is all it needs
+        self._page: Optional[Page] = None
+        self._page_crashed = False
+        # in-memory TTL cache of the last scrape result (monotonic ts, result)
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._cache_ttl = cache_ttl
+        # the cached result pre-serialized once per TTL window (served as-is by the API)
+        self._cached_bytes: bytes = b""
+        # gzip of _cached_bytes, compressed once per refresh instead of per request
+        self._cached_gz: bytes = b""
+        # single-flight: concurrent callers coalesce onto one navigation
+        self._lock = asyncio.Lock()
 
     async def start(self):
-        if self._browser:
+        # the http backend only needs a browser if the static parse comes up empty
+        if self.backend == "playwright":
+            await self._start_browser()
+
+    async def _start_browser(self):
+        if self._ctx:
             return
         self._pw = await async_playwright().start()
-        self._browser = await self._pw.chromium.launch(headless=self.headless)
+        try:
+            # one long-lived context with one long-lived page
+            if self.user_data_dir:
+                self._ctx = await self._pw.chromium.launch_persistent_context(
+                    self.user_data_dir,
+                    headless=self.headless,
+                    args=_CHROMIUM_ARGS,
+                    **self._context_options(),
+                )
+                self._apply_timeouts(self._ctx)
+            else:
+                self._browser = await self._pw.chromium.launch(headless=self.headless, args=_CHROMIUM_ARGS)
+                self._ctx = await self._new_context()
+            if self.block_resources:
+                await self._ctx.route("**/*", self._route)
+            # launch_persistent_context already opens a page; reuse it instead of leaking it
+            if self._ctx.pages:
+                self._track_page(self._ctx.pages[0])
+            else:
+                await self._new_page()
+        except BaseException:
+            # don't leave a driver (or half-started browser) behind for the next attempt
+            await self._stop_browser()
+            raise
 
     async def stop(self):
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        await self._stop_browser()
+
+    async def _stop_browser(self):
+        # suppress close errors: this also tears down a browser that already died
+        if self._page:
+            with contextlib.suppress(Exception):
+                await self._page.close()
+            self._page = None
+        self._page_crashed = False
+        if self._ctx:
+            with contextlib.suppress(Exception):
+                await self._ctx.close()
+            self._ctx = None
         if self._browser:
-            await self._browser.close()
+            with contextlib.suppress(Exception):
+                await self._browser.close()
             self._browser = None
         if self._pw:
-            await self._pw.stop()
+            with contextlib.suppress(Exception):
+                await self._pw.stop()
             self._pw = None
 
-    async def _new_context(self) -> BrowserContext:
-        assert self._browser is not None, "Call start() first."
-        ctx = await self._browser.new_context(
+    # ---------- reusable page ----------
+
+    def _track_page(self, page: Page):
+        def _on_crash(p):
+            # a crashed target is not is_closed(); flag it so it is never reused
+            if p is self._page:
+                self._page_crashed = True
+        page.on("crash", _on_crash)
+        self._page = page
+        self._page_crashed = False
+
+    async def _new_page(self):
+        assert self._ctx is not None
+        self._track_page(await self._ctx.new_page())
+
+    def _page_usable(self) -> bool:
+        return self._page is not None and not self._page_crashed and not self._page.is_closed()
+
+    async def _replace_page(self):
+        """Close the current page and open a fresh one; tear the browser down if that fails."""
+        if self._page:
+            with contextlib.suppress(Exception):
+                await self._page.close()
+            self._page = None
+        try:
+            await self._new_page()
+        except Exception:
+            # context/browser is gone: the next attempt relaunches from scratch
+            await self._stop_browser()
+            raise
+
+    async def _acquire_page(self) -> Page:
+        await self._start_browser()
+        if not self._page_usable():
+            try:
+                await self._replace_page()
+            except Exception:
+                await self._start_browser()
+        assert self._page is not None
+        return self._page
+
+    async def _release_page(self, page: Page, ok: bool):
+        # stop() (or a relaunch) ran meanwhile: this page is no longer ours to manage
+        if page is not self._page:
+            return
+        if ok and self._page_usable():
+            return
+        # a page that errored or crashed mid-scrape is replaced rather than reused
+        try:
+            await self._replace_page()
+        except Exception:
+            log.warning("could not replace browser page; relaunching on next scrape", exc_info=True)
+
+    def _context_options(self) -> Dict[str, Any]:
+        return dict(
             user_agent=self.user_agent,
             viewport={"width": 1400, "height": 900},
             java_script_enabled=True,
             timezone_id=self.timezone_id,
             locale=self.locale,
         )
+
+    def _apply_timeouts(self, ctx: BrowserContext):
         ctx.set_default_timeout(self.default_timeout_ms)
         ctx.set_default_navigation_timeout(self.default_timeout_ms)
 
-        if self.block_resources:
-            async def _route(route, request):
-                rt = request.resource_type
-                if rt in ("image", "media", "font", "stylesheet"):
-                    await route.abort()
-                else:
-                    await route.continue_()
-            await ctx.route("**/*", _route)
-
+    async def _new_context(self) -> BrowserContext:
+        assert self._browser is not None, "Call start() first."
+        ctx = await self._browser.new_context(**self._context_options())
+        self._apply_timeouts(ctx)
         return ctx
 
+    @staticmethod
+    async def _route(route, request):
+        rt = request.resource_type
+        url = request.url
+        if rt in _BLOCK_TYPES or (
+            not _FIRST_PARTY.match(url)
+            and (rt in _XHR_TYPES or _BLOCK_HOSTS.match(url))
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
     # ---------- extraction ----------
 
     async def _extract_js(self, page: Page) -> List[Dict[str, Optional[str]]]:
@@ -89,7 +324,24 @@ class PBFcmsScraper:
         """
         js = """
 (() => {
-  const out = [];
+  // columnar (SoA) result: avoids repeating the three key strings per row over CDP
+  const titles = [], labels = [], hrefs = [];
+  const seen = new Set();
+
+  // hrefs arrive already absolute (a.href); drop the fragment and dedupe on title|label|href
+  const push = (title, label, href) => {
+    const abs = href ? href.split('#')[0] : null;
+    const k = (title || '') + '\\u0001' + (label || '') + '\\u0001' + (abs || '');
+    if (seen.has(k)) return;
+    seen.add(k);
+    titles.push(title);
+    labels.push(label);
+    hrefs.push(abs);
+  };
+
+  // textContent (unlike innerText) does not force a layout per access;
+  // collapse whitespace runs once per value, as innerText rendering would
+  const text = el => (el.textContent || "").replace(/\\s+/g, " ").trim();
 
   // Primary path: explicit class names
   const entities = Array.from(document.querySelectorAll(".tax-list-entity-title"));
@@ -98,18 +350,14 @@ class PBFcmsScraper:
   const record = (title, elFile) => {
     if (!elFile) return;
     let a = elFile.matches('a') ? elFile : elFile.querySelector('a');
-    const label = (a ? a.innerText : elFile.innerText) ? (a ? a.innerText.trim() : elFile.innerText.trim()) : null;
-    const href  = a ? a.getAttribute('href') : null;
-    out.push({
-      "tax-list-entity-title": title ? title.trim() : null,
-      "tax-list-file": label,
-      "tax-list-file href": href
-    });
+    const label = text(a || elFile) || null;
+    const href  = a && a.getAttribute('href') ? a.href : null;
+    push(title || null, label, href);
   };
 
   if (hasExplicit) {
     for (const titleEl of entities) {
-      const title = titleEl.innerText || titleEl.textContent || "";
+      const title = text(titleEl);
       // common wrappers
       const root = titleEl.closest(".tax-list-entity") || titleEl.parentElement || document;
       const files = root.querySelectorAll(".tax-list-file, .tax-list-file a");
@@ -124,100 +372,125 @@ class PBFcmsScraper:
   } else {
     // Robust fallback if the page lacks those classes:
     // Find section headers (e.g., counties) then list following links.
+    const RX = /county|pct|sale|isd|sheriff/i;
     const sections = Array.from(document.querySelectorAll("h1,h2,h3,strong,b,li"));
     for (const s of sections) {
-      const txt = (s.innerText || "").trim();
-      if (!txt) continue;
+      const txt = text(s);
+      // headers are short: skip empty/tiny strings and whole paragraphs before any regex
+      if (txt.length > 200 || txt.length < 3) continue;
       // Heuristic: likely "X COUNTY" or "Pct" style entries
-      if (!/[A-Za-z]/.test(txt)) continue;
-      if (!/county|pct|sale|isd|sheriff/i.test(txt)) continue;
+      if (!RX.test(txt)) continue;
 
       let container = s.closest("li,section,div,ul,ol") || s.parentElement || document;
       const links = container.querySelectorAll("a[href]");
       let hit = false;
       links.forEach(a => {
-        const label = (a.innerText || a.textContent || "").trim();
-        const href  = a.getAttribute('href');
-        if (!href) return;
+        const label = text(a);
+        const attr  = a.getAttribute('href');
+        if (!attr) return;
         // basic filter: avoid page anchors only
-        if (href.startsWith("#")) return;
-        out.push({
-          "tax-list-entity-title": txt,
-          "tax-list-file": label || null,
-          "tax-list-file href": href
-        });
+        if (attr.startsWith("#")) return;
+        push(txt, label || null, a.href);
         hit = true;
       });
       if (hit) {
         // do not over-collect from same container multiple times
-        // rely on duplication-removal on Python side
+        // rely on duplication-removal in push()
       }
     }
   }
 
-  return out;
+  return {titles, labels, hrefs};
 })();
         """
-        rows = await page.evaluate(js)
-        # absolutize URLs and dedupe
-        seen = set()
-        cleaned: List[Dict[str, Optional[str]]] = []
-        for r in rows:
-            href = r.get("tax-list-file href")
-            if href:
-                absu = urljoin(PBF_URL, href)
-                absu, _ = urldefrag(absu)
-                r["tax-list-file href"] = absu
-            key = (r.get("tax-list-entity-title") or "", r.get("tax-list-file") or "", r.get("tax-list-file href") or "")
-            if key in seen:
-                continue
-            seen.add(key)
-            cleaned.append(r)
-        return cleaned
+        # URLs come back absolute and de-duplicated from the page side
+        cols = await page.evaluate(js)
+        return [
+            {"tax-list-entity-title": t, "tax-list-file": l, "tax-list-file href": h}
+            for t, l, h in zip(cols["titles"], cols["labels"], cols["hrefs"])
+        ]
 
-    # ---------- normalization ----------
+    async def _extract_http(self) -> List[Dict[str, Optional[str]]]:
+        """Fetch the page over plain HTTP and parse it with _parse_html."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self.default_timeout_ms / 1000,
+                headers={"User-Agent": self.user_agent},
+                follow_redirects=True,
+            )
+        resp = await self._http.get(PBF_URL)
+        resp.raise_for_status()
+        return _parse_html(resp.text, str(resp.url))
 
-    @staticmethod
-    def _file_type(url: Optional[str]) -> Optional[str]:
-        if not url:
-            return None
-        path = urlparse(url).path.lower()
-        if path.endswith(".pdf"):
-            return "pdf"
-        if path.endswith(".doc") or path.endswith(".docx"):
-            return "doc"
-        if path.endswith(".xls") or path.endswith(".xlsx"):
-            return "xls"
-        return None
+    async def _extract_browser(self) -> List[Dict[str, Optional[str]]]:
+        page = await self._acquire_page()
+        ok = False
+        try:
+            await page.goto(PBF_URL, wait_until="domcontentloaded")
+            try:
+                # proceed as soon as the data is in the DOM (no fixed sleep)
+                await page.wait_for_selector(".tax-list-entity-title", timeout=3000, state="attached")
+            except Exception:
+                # page lacks the explicit classes; the JS fallback handles it
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=3000)
+                except Exception:
+                    pass
 
-    def _normalize(self, raw: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
-        entity = (raw.get("tax-list-entity-title") or "").strip() or None
-        label  = (raw.get("tax-list-file") or "").strip() or None
-        href   = raw.get("tax-list-file href") or None
-        return {
-            "entity_title": entity,
-            "file_label": label,
-            "file_url": href,
-            "file_type": self._file_type(href),
-        }
+            rows = await self._extract_js(page)
+            ok = True
+            return rows
+        finally:
+            await self._release_page(page, ok)
 
     # ---------- public API ----------
 
-    async def scrape(self) -> Dict[str, Any]:
-        await self.start()
-        ctx = await self._new_context()
-        page = await ctx.new_page()
-        await page.goto(PBF_URL, wait_until="domcontentloaded")
-        try:
-            # give the page a brief moment to finish layout
-            await page.wait_for_timeout(400)
-        except Exception:
-            pass
+    def _cached(self) -> Optional[Dict[str, Any]]:
+        if self._cache is None:
+            return None
+        ts, result = self._cache
+        if time.monotonic() - ts < self._cache_ttl:
+            return result
+        return None
+
+    async def scrape(self, fresh: bool = False) -> Dict[str, Any]:
+        if not fresh:
+            hit = self._cached()
+            if hit is not None:
+                return hit
+        async with self._lock:
+            # another caller may have refreshed the cache while we waited
+            if not fresh:
+                hit = self._cached()
+                if hit is not None:
+                    return hit
+            result = await self._scrape()
+            self._cached_bytes = orjson.dumps(result)
+            self._cached_gz = gzip.compress(self._cached_bytes, compresslevel=6)
+            self._cache = (time.monotonic(), result)
+            return result
 
-        raw_rows = await self._extract_js(page)
-        norm_rows = [self._normalize(r) for r in raw_rows]
+    async def _scrape(self) -> Dict[str, Any]:
+        raw_rows: List[Dict[str, Optional[str]]] = []
+        if self.backend == "http":
+            try:
+                raw_rows = await self._extract_http()
+            except httpx.HTTPError as e:
+                log.warning("static fetch of %s failed (%s); falling back to Chromium", PBF_URL, e)
+                raw_rows = []
+        if not raw_rows:
+            raw_rows = await self._extract_browser()
 
-        await ctx.close()
+        # single-pass normalization
+        norm_rows = [
+            {
+                "entity_title": (r.get("tax-list-entity-title") or "").strip() or None,
+                "file_label": (r.get("tax-list-file") or "").strip() or None,
+                "file_url": r.get("tax-list-file href") or None,
+                "file_type": _file_type(r.get("tax-list-file href")),
+            }
+            for r in raw_rows
+        ]
         return {
             "source_url": PBF_URL,
             "count": len(raw_rows),
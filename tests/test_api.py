@@ -0,0 +1,24 @@
+# tests/test_api.py
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from pbfcm_api import _accepts_gzip
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, GZIP;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.000", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),
+    ("*;q=0, gzip", True),
+    ("deflate, br", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
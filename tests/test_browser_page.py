@@ -0,0 +1,213 @@
+# tests/test_browser_page.py
+# Reused-page lifecycle of the browser backend, driven by a fake Playwright.
+
+import asyncio
+
+import pytest
+
+import pbfcm_engine
+from pbfcm_engine import PBFcmsScraper
+
+class FakePage:
+    def __init__(self, env):
+        self.env = env
+        self.closed = False
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def crash(self):
+        self.handlers["crash"](self)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def goto(self, url, **kw):
+        if self.env.fail_goto:
+            raise RuntimeError("navigation failed")
+
+    async def wait_for_selector(self, *a, **kw):
+        pass
+
+    async def wait_for_load_state(self, *a, **kw):
+        pass
+
+    async def evaluate(self, js):
+        return {"titles": ["Harris County"], "labels": ["Sale List"], "hrefs": ["https://www.pbfcm.com/h.pdf"]}
+
+class FakeContext:
+    def __init__(self, env):
+        self.env = env
+        self.pages = []
+
+    async def new_page(self):
+        if self.env.fail_new_page:
+            raise RuntimeError("target closed")
+        page = FakePage(self.env)
+        self.pages.append(page)
+        self.env.opened_pages.append(page)
+        return page
+
+    async def route(self, *a):
+        pass
+
+    def set_default_timeout(self, ms):
+        pass
+
+    def set_default_navigation_timeout(self, ms):
+        pass
+
+    async def close(self):
+        pass
+
+class FakeBrowser:
+    def __init__(self, env):
+        self.env = env
+
+    async def new_context(self, **kw):
+        return FakeContext(self.env)
+
+    async def close(self):
+        pass
+
+class FakeChromium:
+    def __init__(self, env):
+        self.env = env
+
+    async def launch(self, **kw):
+        if self.env.fail_launch:
+            raise RuntimeError("launch failed")
+        self.env.launches += 1
+        return FakeBrowser(self.env)
+
+class FakePlaywright:
+    def __init__(self, env):
+        self.env = env
+        self.chromium = FakeChromium(env)
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+class Env:
+    def __init__(self):
+        self.fail_goto = False
+        self.fail_new_page = False
+        self.fail_launch = False
+        self.launches = 0
+        self.drivers = []
+        self.opened_pages = []
+
+    def async_playwright(self):
+        env = self
+
+        class _Starter:
+            async def start(self):
+                pw = FakePlaywright(env)
+                env.drivers.append(pw)
+                return pw
+
+        return _Starter()
+
+@pytest.fixture
+def env(monkeypatch):
+    env = Env()
+    monkeypatch.setattr(pbfcm_engine, "async_playwright", env.async_playwright)
+    return env
+
+def _scraper():
+    return PBFcmsScraper(backend="playwright")
+
+def test_page_is_reused_between_scrapes(env):
+    async def run():
+        s = _scraper()
+        await s._extract_browser()
+        await s._extract_browser()
+        await s.stop()
+    asyncio.run(run())
+    assert len(env.opened_pages) == 1
+
+def test_crashed_page_is_replaced(env):
+    async def run():
+        s = _scraper()
+        await s._extract_browser()
+        env.opened_pages[0].crash()
+        rows = await s._extract_browser()
+        await s.stop()
+        return rows
+    assert asyncio.run(run())[0]["tax-list-entity-title"] == "Harris County"
+    assert len(env.opened_pages) == 2
+    assert env.opened_pages[0].closed
+
+def test_failed_scrape_replaces_page(env):
+    async def run():
+        s = _scraper()
+        await s.start()
+        env.fail_goto = True
+        with pytest.raises(RuntimeError):
+            await s._extract_browser()
+        assert env.opened_pages[0].closed
+        env.fail_goto = False
+        await s._extract_browser()
+        await s.stop()
+    asyncio.run(run())
+    assert len(env.opened_pages) == 2
+
+def test_refill_failure_relaunches_browser(env):
+    async def run():
+        s = _scraper()
+        await s.start()
+        env.fail_goto = True
+        env.fail_new_page = True
+        with pytest.raises(RuntimeError):
+            await s._extract_browser()
+        # replacement failed: browser torn down instead of leaving a dead page
+        assert s._ctx is None and env.drivers[0].stopped
+        env.fail_goto = False
+        env.fail_new_page = False
+        await asyncio.wait_for(s._extract_browser(), 1)
+        await s.stop()
+    asyncio.run(run())
+    assert env.launches == 2
+
+def test_double_failure_does_not_hang(env):
+    async def run():
+        s = _scraper()
+        await s.start()
+        env.fail_goto = True
+        env.fail_new_page = True
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(s._extract_browser(), 1)
+        env.fail_goto = False
+        env.fail_new_page = False
+        await asyncio.wait_for(s._extract_browser(), 1)
+        await s.stop()
+    asyncio.run(run())
+
+def test_failed_launch_stops_driver(env):
+    async def run():
+        s = _scraper()
+        env.fail_launch = True
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await s.start()
+        return s
+    s = asyncio.run(run())
+    assert s._pw is None
+    assert len(env.drivers) == 2 and all(pw.stopped for pw in env.drivers)
+
+def test_stop_during_scrape(env):
+    async def run():
+        s = _scraper()
+        await s.start()
+        page = s._page
+        await s.stop()
+        # the scrape's finally block must not blow up after shutdown
+        await s._release_page(page, ok=False)
+        await s._release_page(page, ok=True)
+    asyncio.run(run())
@@ -0,0 +1,88 @@
+# tests/test_parse_html.py
+# The static-HTML backend must return the same rows/strings as the JS extractor.
+
+import asyncio
+
+import pytest
+
+from pbfcm_engine import PBF_URL, PBFcmsScraper, _parse_html
+
+FIXTURE = """
+<html><body>
+  <div class="tax-list-entity">
+    <div class="tax-list-entity-title">Harris <b>County</b></div>
+    <div class="tax-list-file"><a href="/files/harris.pdf#page=2">Sale <span>List</span>&nbsp;</a></div>
+    <div class="tax-list-file"><a href="/files/harris.pdf">Sale <span>List</span></a></div>
+  </div>
+  <div class="tax-list-entity">
+    <div class="tax-list-entity-title">  Fort Bend ISD </div>
+    <p><a href="https://www.pbfcm.com/docs/fb.xlsx">Sheriff
+      Sale</a></p>
+  </div>
+</body></html>
+"""
+
+EXPECTED = [
+    {
+        "tax-list-entity-title": "Harris County",
+        "tax-list-file": "Sale List",
+        "tax-list-file href": "https://www.pbfcm.com/files/harris.pdf",
+    },
+    {
+        "tax-list-entity-title": "Fort Bend ISD",
+        "tax-list-file": "Sheriff Sale",
+        "tax-list-file href": "https://www.pbfcm.com/docs/fb.xlsx",
+    },
+]
+
+# <base href>, a title that is its own wrapper, and an empty href
+EDGE_FIXTURE = """
+<html><head><base href="https://www.pbfcm.com/docs/"></head><body>
+  <div>
+    <div class="tax-list-entity-title tax-list-entity">Brazoria
+      <span class="tax-list-file"><a href="bz.pdf">Brazoria List</a></span>
+    </div>
+    <div class="tax-list-file"><a href="outside.pdf">Outside</a></div>
+  </div>
+  <div class="tax-list-entity">
+    <div class="tax-list-entity-title">Galveston</div>
+    <div class="tax-list-file"><a href="">Pending</a></div>
+  </div>
+</body></html>
+"""
+
+EDGE_EXPECTED = [
+    {
+        "tax-list-entity-title": "Brazoria Brazoria List",
+        "tax-list-file": "Brazoria List",
+        "tax-list-file href": "https://www.pbfcm.com/docs/bz.pdf",
+    },
+    {
+        "tax-list-entity-title": "Galveston",
+        "tax-list-file": "Pending",
+        "tax-list-file href": None,
+    },
+]
+
+@pytest.mark.parametrize("html, expected", [(FIXTURE, EXPECTED), (EDGE_FIXTURE, EDGE_EXPECTED)])
+def test_parse_html_matches_textcontent(html, expected):
+    assert _parse_html(html, PBF_URL) == expected
+
+@pytest.mark.parametrize("html", [FIXTURE, EDGE_FIXTURE])
+def test_parse_html_matches_js_extractor(html):
+    async def run():
+        scraper = PBFcmsScraper(backend="playwright", block_resources=False)
+        try:
+            await scraper.start()
+        except Exception as e:
+            await scraper.stop()
+            pytest.skip(f"Chromium not available: {e}")
+        try:
+            page = await scraper._ctx.new_page()
+            await page.route(PBF_URL, lambda route: route.fulfill(body=html, content_type="text/html"))
+            await page.goto(PBF_URL)
+            return await scraper._extract_js(page)
+        finally:
+            await scraper.stop()
+
+    assert asyncio.run(run()) == _parse_html(html, PBF_URL)